@@ -690,8 +690,7 @@ def sync_config_from_excel(
         print("[ERROR] Could not find 'Test Sutie ID' or 'Test Suite ID' column in sheet")
         return []
     
-    from models_config import STATIC_MODELS_CONFIG
-    config_by_type = STATIC_MODELS_CONFIG
+    from models_config import get_static_models_by_edit_id
     base_model_type = MODEL_SHEET_MAPPING.get(sheet_name, "gbdf_mcr")
     config_updates = []
     
@@ -732,10 +731,9 @@ def sync_config_from_excel(
         model_name_with_lob = parsed["model_name_with_lob"]
         row_model_type = "gbdf_grs" if (base_model_type == "gbdf_mcr" and is_grs_edit(edit_string, sheet_name)) else base_model_type
         
-        current_config = config_by_type.get(row_model_type, [])
         existing_entry = None
-        for config in current_config:
-            if config.get("edit_id") == edit_id and _eob_codes_match(config.get("code"), eob_code):
+        for config in get_static_models_by_edit_id(row_model_type, edit_id):
+            if _eob_codes_match(config.get("code"), eob_code):
                 existing_entry = config
                 break
         
@@ -902,7 +900,7 @@ def process_edits_from_excel(
         print("[WARNING] Could not find 'Test Sutie ID' or 'Test Suite ID' column; sync from Excel and TS assignment may be limited")
 
     # Read current config
-    from models_config import STATIC_MODELS_CONFIG
+    from models_config import STATIC_MODELS_CONFIG, get_static_models_by_edit_id
     config_by_type = STATIC_MODELS_CONFIG
     
     # Track TS numbers per model to avoid duplicates during this run
@@ -969,8 +967,8 @@ def process_edits_from_excel(
         
         # Check if edit_id already exists in config (with same EOB code; v05 and 00W05 match)
         existing_entry = None
-        for config in current_config:
-            if config.get("edit_id") == edit_id and _eob_codes_match(config.get("code"), eob_code):
+        for config in get_static_models_by_edit_id(row_model_type, edit_id):
+            if _eob_codes_match(config.get("code"), eob_code):
                 existing_entry = config
                 break
         
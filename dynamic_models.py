@@ -100,7 +100,75 @@ def format_ts_argument(ts_number: str) -> str:
 # STAGE 3: Main Folder Discovery Function
 # This is the core function that scans directories and finds TS folders
 
-def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = False) -> List[Dict]:
+# TS folder name patterns, compiled once at import and tried in order
+# WGS_NYK - standard: NYKTS_149_Wgs_WGS_NYK_RULEPREV00001_00W28_sur
+#           alternative: NYKTS_149_Preventative Medicine and Screening IPREP-362_RULERCTH00001_00W28_sur
+_WGS_NYK_FOLDER_PATTERNS = (
+    re.compile(r'NYKTS_(\d{1,3})_(.+?)_WGS_NYK_([A-Za-z0-9]+(?:\s+[A-Za-z0-9\-]+)?)_([A-Za-z0-9]+)_sur$'),
+    re.compile(r'NYKTS_(\d{1,3})_(.+?)_(RULE[A-Za-z0-9]+)_([A-Za-z0-9]+)_sur$'),
+)
+# Alternative NYKTS naming accepted during folder scanning (no _WGS_NYK_ marker)
+_WGS_NYK_RULE_FOLDER_RE = re.compile(r"NYKTS_\d+_.+_RULE[A-Z0-9]+_.+_sur$")
+# GBDF - GBDTS_* first, then TS_* (both naming conventions exist in source folders).
+# The LOB marker is spelled "gbd_mcr"/"gbd_grs" on disk (older folders use "gbdf_"), and
+# edit IDs may contain underscores/spaces (e.g. RULEUSD00100_Outpt_MCR), so the code is
+# the last token before _sur
+_GBDF_FOLDER_PATTERNS = (
+    re.compile(r'GBDTS_(\d{1,3})_(.+?)_gbdf?_(mcr|grs)_(.+)_([A-Za-z0-9]+)_sur$'),
+    re.compile(r'TS_(\d{1,3})_(.+?)_gbdf?_(mcr|grs)_(.+)_([A-Za-z0-9]+)_sur$'),
+)
+# WGS_CSBD - CSBDTS/CSBD_TS first, then TS patterns (including legacy REVENUE)
+# Suffix variations: _sur, _payloads_sur, _ayloads_sur (typo variant for backward compatibility)
+_WGS_CSBD_FOLDER_PATTERNS = (
+    re.compile(r'CSBD_TS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|payloads_sur|ayloads_sur)$'),
+    re.compile(r'CSBDTS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|payloads_sur|ayloads_sur)$'),
+    re.compile(r'TS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|payloads_sur|ayloads_sur)$'),
+    re.compile(r'TS_(\d{1,3})_REVENUE_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|payloads_sur|ayloads_sur)$'),  # Legacy pattern
+)
+_SUB_EDIT_RE = re.compile(r'Sub Edit (\d+)')
+
+# Discovery results per (base_dir, use_wgs_csbd_destination, subtype), reused while
+# the folder tree signature is unchanged. A key maps to None after its first scan: the
+# signature is only computed once a key is scanned again, so one-shot CLI runs skip it
+_DISCOVERY_CACHE: Dict[tuple, Optional[tuple]] = {}
+
+
+def clear_discovery_cache() -> None:
+    """Forget all cached discovery results so the next call rescans the folders."""
+    _DISCOVERY_CACHE.clear()
+
+
+def _discovery_signature(base_dir: str) -> Optional[tuple]:
+    """
+    Build a cheap signature of a source tree for discovery caching.
+
+    Covers the base directory, each TS folder and its payloads folder, which is
+    everything discover_ts_folders looks at (folder names and regression/smoke presence).
+
+    Args:
+        base_dir: Base directory that is scanned for TS folders
+
+    Returns:
+        Tuple of (name, mtime_ns) pairs, or None if base_dir cannot be read
+    """
+    try:
+        signature = [("", os.stat(base_dir).st_mtime_ns)]
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                signature.append((entry.name, entry.stat().st_mtime_ns))
+                try:
+                    payloads_mtime = os.stat(os.path.join(entry.path, "payloads")).st_mtime_ns
+                except OSError:
+                    payloads_mtime = None
+                signature.append((entry.name + "/payloads", payloads_mtime))
+    except OSError:
+        return None
+    return tuple(sorted(signature, key=lambda item: item[0]))
+
+
+def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = False, subtype: Optional[str] = None) -> List[Dict]:
     """
     Discover all TS_XX_REVENUE_WGS_CSBD_* folders and extract model parameters.
     Supports flexible digit patterns: TS01-TS09, TS10-TS99, TS100-TS999
@@ -108,10 +176,21 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
     
     Args:
         base_dir: Base directory to search for TS folders
+        use_wgs_csbd_destination: If True, WGS_CSBD models go to renaming_jsons/CSBDTS
+        subtype: For GBDF directories, "mcr" or "grs" to only scan that subtype's
+            folders (None scans both)
         
     Returns:
         List of model configurations extracted from folder names
     """
+    # STAGE 3.0: Reuse the previous scan if the folder tree has not changed
+    cache_key = (os.path.abspath(base_dir), use_wgs_csbd_destination, subtype)
+    cached = _DISCOVERY_CACHE.get(cache_key)
+    signature = _discovery_signature(base_dir) if cache_key in _DISCOVERY_CACHE else None
+    if signature is not None and cached is not None and cached[0] == signature:
+        print(f"Using cached TS folder discovery for: {base_dir} ({len(cached[1])} models)")
+        return [dict(model) for model in cached[1]]
+
     models = []
     
     # Check if this is a GBDF directory or WGS_Kernal directory
@@ -134,13 +213,17 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
             f for f in all_folders
             if os.path.isdir(f)
             and f.endswith("_sur")
-            and ("_WGS_NYK_" in os.path.basename(f) or re.search(r"NYKTS_\d+_.+_RULE[A-Z0-9]+_.+_sur$", os.path.basename(f)))
+            and ("_WGS_NYK_" in os.path.basename(f) or _WGS_NYK_RULE_FOLDER_RE.search(os.path.basename(f)))
         ]
     elif is_gbdf:
         # GBDF patterns - use catch-all patterns instead of listing every model
+        # Only the requested subtype is globbed, so the other subtype is never listed
+        subtypes = [subtype.lower()] if subtype else ["mcr", "grs"]
         patterns = [
-            os.path.join(base_dir, "GBDTS_*_*_gbdf_mcr_*_sur"),
-            os.path.join(base_dir, "GBDTS_*_*_gbdf_grs_*_sur")
+            os.path.join(base_dir, f"{prefix}_*_*_{lob}_{name}_*_sur")
+            for prefix in ("GBDTS", "TS")
+            for name in subtypes
+            for lob in ("gbd", "gbdf")
         ]
         ts_folders_list = get_folders_from_patterns(patterns)
         # Filter to only include directories (consistent with other branches)
@@ -168,34 +251,18 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
         def try_patterns(patterns):
             """Try multiple regex patterns and return first match."""
             for pattern in patterns:
-                match = re.match(pattern, folder_name)
+                match = pattern.match(folder_name)
                 if match:
                     return match
             return None
         
-        # Define patterns based on directory type
+        # Select the precompiled patterns for this directory type
         if is_wgs_kernal:
-            # Standard: NYKTS_149_Wgs_WGS_NYK_RULEPREV00001_00W28_sur
-            # Alternative: NYKTS_149_Preventative Medicine and Screening IPREP-362_RULERCTH00001_00W28_sur
-            patterns = [
-                r'NYKTS_(\d{1,3})_(.+?)_WGS_NYK_([A-Za-z0-9]+(?:\s+[A-Za-z0-9\-]+)?)_([A-Za-z0-9]+)_sur$',
-                r'NYKTS_(\d{1,3})_(.+?)_(RULE[A-Za-z0-9]+)_([A-Za-z0-9]+)_sur$',
-            ]
+            patterns = _WGS_NYK_FOLDER_PATTERNS
         elif is_gbdf:
-            # GBDF patterns - check GBDTS_* first, then TS_* (both naming conventions exist in source folders)
-            patterns = [
-                r'GBDTS_(\d{1,3})_(.+?)_gbdf_(mcr|grs)_([A-Za-z0-9]+)_([A-Za-z0-9]+)_sur$',
-                r'TS_(\d{1,3})_(.+?)_gbdf_(mcr|grs)_([A-Za-z0-9]+)_([A-Za-z0-9]+)_sur$'
-            ]
+            patterns = _GBDF_FOLDER_PATTERNS
         else:
-            # WGS_CSBD patterns - try CSBDTS/CSBD_TS first, then TS patterns (including legacy REVENUE)
-            # Handle suffix variations: _sur, _payloads_sur, _ayloads_sur (typo variant for backward compatibility)
-            patterns = [
-                r'CSBD_TS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|payloads_sur|ayloads_sur)$',
-                r'CSBDTS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|payloads_sur|ayloads_sur)$',
-                r'TS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|payloads_sur|ayloads_sur)$',
-                r'TS_(\d{1,3})_REVENUE_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|payloads_sur|ayloads_sur)$'  # Legacy pattern
-            ]
+            patterns = _WGS_CSBD_FOLDER_PATTERNS
         
         match = try_patterns(patterns)
         
@@ -203,12 +270,13 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
         if match:
             # Extract components based on pattern type
             groups = match.groups()
+            gbdf_subtype = None  # "mcr"/"grs" for GBDF folders, whichever LOB spelling they use
             if is_wgs_kernal:
                 # NYKTS pattern: 4 groups (ts, model_name, edit_id, code)
                 ts_number_raw, model_name, edit_id, code = groups[0], groups[1], groups[2], groups[3]
             elif is_gbdf:
                 # GBDF patterns: 5 groups (ts, model_name, mcr/grs, edit_id, code)
-                ts_number_raw, model_name, _, edit_id, code = groups[0], groups[1], groups[2], groups[3], groups[4]
+                ts_number_raw, model_name, gbdf_subtype, edit_id, code = groups[0], groups[1], groups[2], groups[3], groups[4]
             else:
                 # WGS_CSBD patterns: Check if legacy REVENUE pattern (4 groups) or new pattern (5 groups)
                 if len(groups) == 4:
@@ -310,7 +378,7 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
                     base_file_name = f"{model_name.lower().replace(' ', '_').replace('-', '_').replace('to', 'to').replace('alignment', 'alignment')}_wgs_csbd_{edit_id}_{code}"
                 elif "Revenue code Services not payable on Facility claim" in folder_name:
                     # Extract the Sub Edit number and create proper collection name
-                    sub_edit_match = re.search(r'Sub Edit (\d+)', folder_name)
+                    sub_edit_match = _SUB_EDIT_RE.search(folder_name)
                     if sub_edit_match:
                         sub_edit_num = sub_edit_match.group(1)
                         base_collection_name = f"TS_{ts_number}_Revenue code Services not payable on Facility claim Sub Edit {sub_edit_num}_Collection"
@@ -388,10 +456,10 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
                     base_file_name = f"covid_gbdf_mcr_{edit_id}_{code}"
                 elif "Multiple E&M Same day" in folder_name and is_gbdf:
                     # For any GBDF Multiple E&M Same day model, use GBDF naming
-                    if "gbdf_mcr" in folder_name:
+                    if gbdf_subtype == "mcr":
                         base_collection_name = f"TS_{ts_number}_Multiple E&M Same day_gbdf_mcr_Collection"
                         base_file_name = f"multiple_em_gbdf_mcr_{edit_id}_{code}"
-                    elif "gbdf_grs" in folder_name:
+                    elif gbdf_subtype == "grs":
                         base_collection_name = f"TS_{ts_number}_Multiple E&M Same day_gbdf_grs_Collection"
                         base_file_name = f"multiple_em_gbdf_grs_{edit_id}_{code}"
                     else:
@@ -399,10 +467,10 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
                         base_file_name = f"multiple_em_gbdf_{edit_id}_{code}"
                 elif "NDC UOM Validation Edit Expansion Iprep-138" in folder_name and is_gbdf:
                     # For NDC UOM Validation Edit Expansion Iprep-138 models, use GBDF naming
-                    if "gbdf_mcr" in folder_name:
+                    if gbdf_subtype == "mcr":
                         base_collection_name = f"TS_{ts_number}_NDC UOM Validation Edit Expansion Iprep-138_gbdf_mcr_Collection"
                         base_file_name = f"ndc_uom_gbdf_mcr_{edit_id}_{code}"
-                    elif "gbdf_grs" in folder_name:
+                    elif gbdf_subtype == "grs":
                         base_collection_name = f"TS_{ts_number}_NDC UOM Validation Edit Expansion Iprep-138_gbdf_grs_Collection"
                         base_file_name = f"ndc_uom_gbdf_grs_{edit_id}_{code}"
                     else:
@@ -410,10 +478,10 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
                         base_file_name = f"ndc_uom_gbdf_{edit_id}_{code}"
                 elif "No match of Procedure code" in folder_name and is_gbdf:
                     # For No match of Procedure code models, use GBDF naming
-                    if "gbdf_mcr" in folder_name:
+                    if gbdf_subtype == "mcr":
                         base_collection_name = f"TS_{ts_number}_No match of Procedure code_gbdf_mcr_Collection"
                         base_file_name = f"no_match_procedure_gbdf_mcr_{edit_id}_{code}"
-                    elif "gbdf_grs" in folder_name:
+                    elif gbdf_subtype == "grs":
                         base_collection_name = f"TS_{ts_number}_No match of Procedure code_gbdf_grs_Collection"
                         base_file_name = f"no_match_procedure_gbdf_grs_{edit_id}_{code}"
                     else:
@@ -421,10 +489,10 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
                         base_file_name = f"no_match_procedure_gbdf_{edit_id}_{code}"
                 elif "Nebulizer A52466 IPERP-132" in folder_name and is_gbdf:
                     # For Nebulizer A52466 IPERP-132 models, use GBDF naming
-                    if "gbdf_mcr" in folder_name:
+                    if gbdf_subtype == "mcr":
                         base_collection_name = f"TS_{ts_number}_Nebulizer A52466 IPERP-132_gbdf_mcr_Collection"
                         base_file_name = f"nebulizer_gbdf_mcr_{edit_id}_{code}"
-                    elif "gbdf_grs" in folder_name:
+                    elif gbdf_subtype == "grs":
                         base_collection_name = f"TS_{ts_number}_Nebulizer A52466 IPERP-132_gbdf_grs_Collection"
                         base_file_name = f"nebulizer_gbdf_grs_{edit_id}_{code}"
                     else:
@@ -432,10 +500,10 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
                         base_file_name = f"nebulizer_gbdf_{edit_id}_{code}"
                 elif "Unspecified_dx_code_outpt" in folder_name and is_gbdf:
                     # For Unspecified_dx_code_outpt models, use GBDF naming
-                    if "gbdf_mcr" in folder_name:
+                    if gbdf_subtype == "mcr":
                         base_collection_name = f"TS_{ts_number}_Unspecified_dx_code_outpt_gbdf_mcr_Collection"
                         base_file_name = f"unspecified_dx_code_outpt_gbdf_mcr_{edit_id}_{code}"
-                    elif "gbdf_grs" in folder_name:
+                    elif gbdf_subtype == "grs":
                         base_collection_name = f"TS_{ts_number}_Unspecified_dx_code_outpt_gbdf_grs_Collection"
                         base_file_name = f"unspecified_dx_code_outpt_gbdf_grs_{edit_id}_{code}"
                     else:
@@ -443,10 +511,10 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
                         base_file_name = f"unspecified_dx_code_outpt_gbdf_{edit_id}_{code}"
                 elif "Unspecified_dx_code_prof" in folder_name and is_gbdf:
                     # For Unspecified_dx_code_prof models, use GBDF naming
-                    if "gbdf_mcr" in folder_name:
+                    if gbdf_subtype == "mcr":
                         base_collection_name = f"TS_{ts_number}_Unspecified_dx_code_prof_gbdf_mcr_Collection"
                         base_file_name = f"unspecified_dx_code_prof_gbdf_mcr_{edit_id}_{code}"
-                    elif "gbdf_grs" in folder_name:
+                    elif gbdf_subtype == "grs":
                         base_collection_name = f"TS_{ts_number}_Unspecified_dx_code_prof_gbdf_grs_Collection"
                         base_file_name = f"unspecified_dx_code_prof_gbdf_grs_{edit_id}_{code}"
                     else:
@@ -485,7 +553,11 @@ def discover_ts_folders(base_dir: str = ".", use_wgs_csbd_destination: bool = Fa
             # STAGE 5.5: Handle unmatched folders
             print(f"Warning: Could not parse folder name: {folder_name}")
     
-    # STAGE 6: Return all discovered models
+    # STAGE 6: Remember this scan and return all discovered models
+    if signature is not None:
+        _DISCOVERY_CACHE[cache_key] = (signature, tuple(dict(model) for model in models))
+    else:
+        _DISCOVERY_CACHE.setdefault(cache_key, None)
     return models
 
 
@@ -0,0 +1,133 @@
+"""
+JSON file helpers shared by the renaming, header/footer and refdb steps.
+
+Uses orjson when it is installed and falls back to the standard json module otherwise.
+"""
+
+import os
+import re
+import json
+import math
+from pathlib import Path
+
+# Optional fast JSON backend; falls back to the standard library when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Integers with 19+ digits may not fit in 64 bits
+_LONG_DIGIT_RUN = re.compile(rb'\d{19,}')
+
+# Line ending text-mode writes used before the helpers switched to bytes
+_NEWLINE = os.linesep.encode('ascii')
+
+
+def iter_payload_files(source_dir):
+    """
+    Yield the JSON payload files directly inside a model's source directory.
+
+    Uses os.scandir so the file-type check reuses the directory entry's cached type
+    instead of issuing a stat per file (only symlinks still need a stat).
+
+    Args:
+        source_dir: Directory to scan (typically a model's source_dir)
+
+    Yields:
+        os.DirEntry for each *.json file
+    """
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                yield entry
+
+
+def parse_json_bytes(raw):
+    """
+    Parse JSON file content, using orjson when it is available.
+
+    Raises json.JSONDecodeError on invalid JSON (orjson's error type subclasses it).
+    """
+    # orjson turns integers beyond 64 bits into floats; leave content with long digit
+    # runs (even inside strings) to the standard library so no precision is lost
+    if orjson is not None and not _LONG_DIGIT_RUN.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN, Infinity and out-of-range numbers (e.g. 1E400) that the
+            # json module accepts; only report an error if the json module fails too
+            pass
+    return json.loads(raw.decode('utf-8'))
+
+
+def _needs_json_module(data):
+    """
+    Return True if data holds a float that orjson would write differently from json.dumps.
+
+    orjson writes NaN/Infinity as null and formats exponents differently
+    (1e-07 -> 1e-7, 1e+22 -> 1e22); every other float, string and container
+    encodes to the same bytes under OPT_INDENT_2.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value) or 'e' in repr(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def encode_json_bytes(data):
+    """
+    Encode data as 2-space indented UTF-8 JSON, using orjson when it is available.
+
+    The result is byte-for-byte what json.dump(data, f, indent=2, ensure_ascii=False)
+    writes to a text-mode file on this platform, including os.linesep line endings.
+    orjson is only used when it produces the same output; data holding non-finite or
+    exponent-formatted floats, or values orjson cannot encode (e.g. integers beyond
+    64 bits), goes through the json module.
+    """
+    encoded = None
+    if orjson is not None and not _needs_json_module(data):
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    if encoded is None:
+        encoded = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    # JSON strings never contain raw newlines, so every b'\n' is a line break
+    if _NEWLINE != b'\n':
+        encoded = encoded.replace(b'\n', _NEWLINE)
+    return encoded
+
+
+def load_json_file(file_path):
+    """
+    Read and parse a JSON file (orjson when available, else the json module).
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON content
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return parse_json_bytes(Path(file_path).read_bytes())
+
+
+def dump_json_file(file_path, data):
+    """
+    Write data as 2-space indented UTF-8 JSON (see encode_json_bytes for the exact format).
+
+    Args:
+        file_path: Path to the JSON file to write
+        data: JSON-serialisable content
+    """
+    Path(file_path).write_bytes(encode_json_bytes(data))
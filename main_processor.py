@@ -26,11 +26,13 @@ import sys
 import subprocess
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 from postman_generator import PostmanCollectionGenerator
 from report_generate import ExcelReportGenerator, TimingTracker, get_excel_reporter, create_excel_reporter_for_model_type
 from rename_files import rename_files, extract_model_info_from_directory
+from models_config import ensure_dest_dirs
 
 # Load environment variables from .env file
 env_path = Path(__file__).parent / '.env'
@@ -51,6 +53,12 @@ POSTMAN_ENABLED_WGS_CSBD = _postman_enabled_for_collection("WGS_CSBD")
 POSTMAN_ENABLED_GBDF_MCR = _postman_enabled_for_collection("GBDF_MCR")
 POSTMAN_ENABLED_GBDF_GRS = _postman_enabled_for_collection("GBDF_GRS")
 POSTMAN_ENABLED_WGS_KERNAL = _postman_enabled_for_collection("WGS_KERNAL")
+
+# Concurrent model processing for process_multiple_models - from .env (default: 1 = sequential)
+try:
+    MODEL_PROCESSING_WORKERS = max(1, int(os.getenv('MODEL_PROCESSING_WORKERS', '1')))
+except ValueError:
+    MODEL_PROCESSING_WORKERS = 1
 try:
     from report_generate import (
         extract_model_name_from_source_dir,
@@ -85,7 +93,106 @@ import re
 # The rename_files() function and related helper functions are now imported from that module.
 
 
-def process_multiple_models(models_config, generate_postman=True, model_type=None):
+def _validate_model_config(model_config):
+    """
+    Check a batch model configuration before any processing starts.
+
+    Args:
+        model_config: Model configuration dictionary
+
+    Returns:
+        Reason string if the configuration cannot be processed, otherwise None
+    """
+    missing = [key for key in ("edit_id", "code") if not model_config.get(key)]
+    if missing:
+        return f"Missing required field(s): {', '.join(missing)}"
+    source_dir = model_config.get("source_dir")
+    # source_dir may be omitted (rename_files derives a default), but a given one must exist
+    if source_dir and not os.path.isdir(source_dir):
+        return f"Source directory not found: {source_dir}"
+    dest_dir = model_config.get("dest_dir")
+    if dest_dir:
+        # dest_dir may not exist yet; it is created under its nearest existing ancestor
+        parent = os.path.abspath(dest_dir)
+        while not os.path.exists(parent) and os.path.dirname(parent) != parent:
+            parent = os.path.dirname(parent)
+        if not os.path.isdir(parent) or not os.access(parent, os.W_OK):
+            return f"Destination directory not writable: {parent}"
+    return None
+
+
+def _process_model_entry(index, total, model_config, generate_postman, excel_reporter, dest_dir_ready=False):
+    """
+    Process one model of a batch and classify the result.
+
+    Args:
+        index: 1-based position of the model in the batch
+        total: Number of models in the batch
+        model_config: Model configuration dictionary
+        generate_postman: Whether to generate the Postman collection
+        excel_reporter: Shared Excel reporter (or None)
+        dest_dir_ready: True if the model's dest_dir was already created for the batch
+
+    Returns:
+        Tuple of (succeeded, record) where record is the summary entry for the model
+    """
+    edit_id = model_config.get("edit_id")
+    code = model_config.get("code")
+    source_dir = model_config.get("source_dir")
+    dest_dir = model_config.get("dest_dir")
+    postman_collection_name = model_config.get("postman_collection_name")
+    label = f"{edit_id}_{code}"  # Model label used in log lines and the batch summary
+    
+    # Emit the model header as one write so it stays together when models run concurrently
+    print("\n".join((
+        f"\nProcessing Model {index}/{total}",
+        f"   Edit ID: {edit_id}",
+        f"   Code: {code}",
+        f"   Source: {source_dir}",
+        f"   Destination: {dest_dir}",
+        "-" * 60,
+    )))
+    
+    try:
+        # Process the model
+        renamed_files = rename_files(
+            edit_id=edit_id,
+            code=code,
+            source_dir=source_dir,
+            dest_dir=dest_dir,
+            generate_postman=generate_postman,
+            postman_collection_name=postman_collection_name,
+            excel_reporter=excel_reporter,
+            create_dest_dir=not dest_dir_ready
+        )
+        
+        if renamed_files:
+            print(f"SUCCESS Model {label}: Successfully processed {len(renamed_files)} files")
+            return True, {
+                "edit_id": edit_id,
+                "code": code,
+                "label": label,
+                "files_count": len(renamed_files)
+            }
+        print(f"WARNING  Model {label}: No files were processed")
+        return False, {
+            "edit_id": edit_id,
+            "code": code,
+            "label": label,
+            "reason": "No files found or processed"
+        }
+            
+    except Exception as e:
+        print(f"ERROR Model {label}: Failed with error - {e}")
+        return False, {
+            "edit_id": edit_id,
+            "code": code,
+            "label": label,
+            "reason": str(e)
+        }
+
+
+def process_multiple_models(models_config, generate_postman=True, model_type=None, max_workers=None):
     """
     STAGE 3: BATCH PROCESSING FUNCTION
     =================================
@@ -93,8 +200,8 @@ def process_multiple_models(models_config, generate_postman=True, model_type=Non
     This function handles batch processing of multiple TS models simultaneously.
     
     PROCESSING FLOW:
-    1. Iterate through each model configuration
-    2. Call rename_files() for each model
+    1. Validate each model configuration; invalid ones fail without being processed
+    2. Call rename_files() for each remaining model (optionally on a thread pool)
     3. Track success/failure for each model
     4. Provide comprehensive summary report
     5. Generate Excel timing report
@@ -102,6 +209,10 @@ def process_multiple_models(models_config, generate_postman=True, model_type=Non
     Args:
         models_config: List of dictionaries containing model configurations
         generate_postman: Whether to generate Postman collections for each model
+        max_workers: Number of models processed concurrently. Defaults to the
+            MODEL_PROCESSING_WORKERS environment variable (1 = sequential). Models write
+            to distinct directories, so file I/O overlaps safely; console output of
+            concurrent models may interleave.
     
     Example models_config:
     [
@@ -132,85 +243,93 @@ def process_multiple_models(models_config, generate_postman=True, model_type=Non
     if REPORT_GENERATION_ENABLED:
         excel_reporter = create_excel_reporter_for_batch_processing(model_type)
     
+    if max_workers is None:
+        max_workers = MODEL_PROCESSING_WORKERS
+    
     total_processed = 0
     successful_models = []
     failed_models = []
     
     # STAGE 3.2: MODEL ITERATION LOOP
     # ===============================
+    total = len(models_config)
+    
+    # Reject invalid configurations up front so they are never dispatched
+    results = {}
+    pending = []
     for i, model_config in enumerate(models_config, 1):
-        edit_id = model_config.get("edit_id")
-        code = model_config.get("code")
-        source_dir = model_config.get("source_dir")
-        dest_dir = model_config.get("dest_dir")
-        postman_collection_name = model_config.get("postman_collection_name")
-        
-        print(f"\nProcessing Model {i}/{len(models_config)}")
-        print(f"   Edit ID: {edit_id}")
-        print(f"   Code: {code}")
-        print(f"   Source: {source_dir}")
-        print(f"   Destination: {dest_dir}")
-        print("-" * 60)
-        
-        try:
-            # Process the model
-            renamed_files = rename_files(
-                edit_id=edit_id,
-                code=code,
-                source_dir=source_dir,
-                dest_dir=dest_dir,
-                generate_postman=generate_postman,
-                postman_collection_name=postman_collection_name,
-                excel_reporter=excel_reporter
-            )
-            
-            if renamed_files:
-                print(f"SUCCESS Model {edit_id}_{code}: Successfully processed {len(renamed_files)} files")
-                successful_models.append({
-                    "edit_id": edit_id,
-                    "code": code,
-                    "files_count": len(renamed_files),
-                    "files": renamed_files
-                })
-                total_processed += len(renamed_files)
-            else:
-                print(f"WARNING  Model {edit_id}_{code}: No files were processed")
-                failed_models.append({
-                    "edit_id": edit_id,
-                    "code": code,
-                    "reason": "No files found or processed"
-                })
-                
-        except Exception as e:
-            print(f"ERROR Model {edit_id}_{code}: Failed with error - {e}")
-            failed_models.append({
-                "edit_id": edit_id,
-                "code": code,
-                "reason": str(e)
+        problem = _validate_model_config(model_config)
+        if problem:
+            label = f"{model_config.get('edit_id')}_{model_config.get('code')}"
+            print(f"WARNING  Model {label}: Skipped - {problem}")
+            results[i] = (False, {
+                "edit_id": model_config.get("edit_id"),
+                "code": model_config.get("code"),
+                "label": label,
+                "reason": problem
             })
+        else:
+            pending.append((i, model_config))
+    
+    # Create every destination directory once before dispatching models; rename_files
+    # then skips its own makedirs for models whose destination was created here.
+    # Only the validated entries are passed, so their source_dirs are not re-checked
+    try:
+        ready_dest_dirs = frozenset(ensure_dest_dirs(model_config for _, model_config in pending))
+    except OSError as e:
+        # Leave directory creation (and error reporting) to each model
+        print(f"[WARNING] Could not pre-create destination directories: {e}")
+        ready_dest_dirs = frozenset()
+    
+    def dest_dir_ready(model_config):
+        return model_config.get("dest_dir") in ready_dest_dirs
+    
+    # Never start more threads than there are models left to process
+    workers = max(1, min(max_workers, len(pending)))
+    if workers == 1:
+        for i, model_config in pending:
+            results[i] = _process_model_entry(i, total, model_config, generate_postman, excel_reporter, dest_dir_ready(model_config))
+    else:
+        print(f"[INFO] Processing {len(pending)} models with {workers} worker threads")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            processed = executor.map(
+                lambda item: _process_model_entry(item[0], total, item[1], generate_postman, excel_reporter, dest_dir_ready(item[1])),
+                pending
+            )
+            for (i, _), result in zip(pending, processed):
+                results[i] = result
+    
+    # Collect results in input order
+    for _, (succeeded, record) in sorted(results.items()):
+        if succeeded:
+            successful_models.append(record)
+            total_processed += record["files_count"]
+        else:
+            failed_models.append(record)
     
     # STAGE 3.3: BATCH PROCESSING SUMMARY
     # ==================================
-    # Summary
-    print("\n" + "=" * 80)
-    print("SUMMARY PROCESSING SUMMARY")
-    print("=" * 80)
-    print(f"Total models processed: {len(models_config)}")
-    print(f"Successful models: {len(successful_models)}")
-    print(f"Failed models: {len(failed_models)}")
-    print(f"Total files processed: {total_processed}")
+    # Summary - assembled first and printed as one write
+    summary_lines = [
+        "\n" + "=" * 80,
+        "SUMMARY PROCESSING SUMMARY",
+        "=" * 80,
+        f"Total models processed: {len(models_config)}",
+        f"Successful models: {len(successful_models)}",
+        f"Failed models: {len(failed_models)}",
+        f"Total files processed: {total_processed}",
+    ]
     
     if successful_models:
-        print(f"\nSUCCESS SUCCESSFUL MODELS:")
-        for model in successful_models:
-            print(f"   - {model['edit_id']}_{model['code']}: {model['files_count']} files")
+        summary_lines.append(f"\nSUCCESS SUCCESSFUL MODELS:")
+        summary_lines.extend(f"   - {model['label']}: {model['files_count']} files" for model in successful_models)
     
     if failed_models:
-        print(f"\nERROR FAILED MODELS:")
-        for model in failed_models:
-            print(f"   - {model['edit_id']}_{model['code']}: {model['reason']}")
+        summary_lines.append(f"\nERROR FAILED MODELS:")
+        summary_lines.extend(f"   - {model['label']}: {model['reason']}" for model in failed_models)
     
-    print("\nTARGET All models processed!")
+    summary_lines.append("\nTARGET All models processed!")
+    print("\n".join(summary_lines))
     
     # Generate Excel timing report (only if report generation is enabled and reporter exists)
     if REPORT_GENERATION_ENABLED and excel_reporter:
@@ -446,8 +565,9 @@ Examples:
     # ======================================
     # Load model configurations with dynamic discovery
     try:
-        from models_config import get_models_config, get_model_by_ts
+        from models_config import get_models_config, get_model_by_ts, index_models_by_ts
         models_config = get_models_config(use_dynamic=True, use_wgs_csbd_destination=args.wgs_csbd, use_gbd_mcr=args.gbdf_mcr, use_gbd_grs=args.gbdf_grs, use_wgs_nyk=args.wgs_nyk)
+        models_by_ts = index_models_by_ts(models_config)
         print("Configuration loaded with dynamic discovery")
     except ImportError as e:
         print(f"Error: {e}")
@@ -552,7 +672,7 @@ Examples:
         # Process each CSBDTS model
         for ts_number_str in args.csbd_ts_models:
             # Find ALL models with matching TS number (both smoke and regression)
-            csbd_ts_models = [model for model in models_config if model.get("ts_number") == ts_number_str]
+            csbd_ts_models = models_by_ts.get(ts_number_str, [])
             if csbd_ts_models:
                 models_to_process.extend(csbd_ts_models)
                 folder_types = [m.get("folder_type", "regression") for m in csbd_ts_models]
@@ -577,7 +697,7 @@ Examples:
         # Process each NYKTS model
         for ts_number_str in args.nyk_ts_models:
             # Find ALL models with matching TS number (both smoke and regression)
-            nyk_ts_models = [model for model in models_config if model.get("ts_number") == ts_number_str]
+            nyk_ts_models = models_by_ts.get(ts_number_str, [])
             if nyk_ts_models:
                 models_to_process.extend(nyk_ts_models)
                 folder_types = [m.get("folder_type", "regression") for m in nyk_ts_models]
@@ -602,7 +722,7 @@ Examples:
         # Process each GBDTS model for MCR
         for ts_number_str in args.gbdf_mcr_ts_models:
             # Find ALL models with matching TS number (both smoke and regression)
-            gbdf_ts_models = [model for model in models_config if model.get("ts_number") == ts_number_str]
+            gbdf_ts_models = models_by_ts.get(ts_number_str, [])
             if gbdf_ts_models:
                 models_to_process.extend(gbdf_ts_models)
                 folder_types = [m.get("folder_type", "regression") for m in gbdf_ts_models]
@@ -627,7 +747,7 @@ Examples:
         # Process each GBDTS model for GRS
         for ts_number_str in args.gbdf_grs_ts_models:
             # Find ALL models with matching TS number (both smoke and regression)
-            gbdf_ts_models = [model for model in models_config if model.get("ts_number") == ts_number_str]
+            gbdf_ts_models = models_by_ts.get(ts_number_str, [])
             if gbdf_ts_models:
                 models_to_process.extend(gbdf_ts_models)
                 folder_types = [m.get("folder_type", "regression") for m in gbdf_ts_models]
@@ -3,7 +3,14 @@
 
 import os
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
 from dynamic_models import discover_ts_folders, get_model_by_ts_number, get_all_models
+from json_io import parse_json_bytes, encode_json_bytes
 
 # Static model configurations (for backward compatibility)
 STATIC_MODELS_CONFIG = {
@@ -1430,6 +1437,16 @@ STATIC_MODELS_CONFIG = {
     ]
 }
 
+# Model variants selectable through get_models_config flags, checked in order:
+# (flag, STATIC_MODELS_CONFIG section, discovery root, use_wgs_csbd_destination, GBDF subtype, label)
+_MODEL_VARIANTS = (
+    ("use_wgs_nyk", "wgs_kernal", "source_folder/WGS_Kernal", False, None, "WGS_NYK"),
+    ("use_gbd_mcr", "gbdf_mcr", "source_folder/GBDF", False, "mcr", "GBDF MCR"),  # GRS folders are not scanned
+    ("use_gbd_grs", "gbdf_grs", "source_folder/GBDF", False, "grs", "GBDF GRS"),  # MCR folders are not scanned
+)
+# Variant used when no flag is set
+_DEFAULT_MODEL_VARIANT = (None, "wgs_csbd", "source_folder/WGS_CSBD", True, None, "WGS_CSBD")
+
 # Dynamic model discovery
 def get_models_config(use_dynamic=True, use_wgs_csbd_destination=False, use_gbd_mcr=False, use_gbd_grs=False, use_wgs_nyk=False):
     """
@@ -1445,79 +1462,26 @@ def get_models_config(use_dynamic=True, use_wgs_csbd_destination=False, use_gbd_
     Returns:
         List of model configurations
     """
-    if use_dynamic:
-        try:
-            if use_wgs_nyk:
-                # Use dynamic discovery for WGS_NYK
-                discovered_models = discover_ts_folders("source_folder/WGS_Kernal", False)
-                if discovered_models:
-                    print(f"Dynamic discovery found {len(discovered_models)} WGS_NYK models")
-                    return discovered_models
-                else:
-                    print("No WGS_NYK models found via dynamic discovery, falling back to static config")
-                    return STATIC_MODELS_CONFIG.get("wgs_kernal", [])
-            elif use_gbd_mcr:
-                # Use dynamic discovery for GBDF MCR
-                discovered_models = discover_ts_folders("source_folder/GBDF", False)
-                # Filter for MCR models only (exclude GRS)
-                # Use source_dir as primary check since it always exists and contains the folder path
-                # Also check folder_name as fallback for robustness
-                mcr_models = [
-                    m for m in discovered_models 
-                    if ("gbd_mcr" in m.get("source_dir", "").lower() or "gbd_mcr" in m.get("folder_name", "").lower())
-                    and "gbd_grs" not in m.get("source_dir", "").lower() 
-                    and "gbd_grs" not in m.get("folder_name", "").lower()
-                ]
-                if mcr_models:
-                    print(f"Dynamic discovery found {len(mcr_models)} GBDF MCR models")
-                    return mcr_models
-                else:
-                    print("No GBDF MCR models found via dynamic discovery, falling back to static config")
-                    return STATIC_MODELS_CONFIG.get("gbd_mcr", [])
-            elif use_gbd_grs:
-                # Use dynamic discovery for GBDF GRS
-                discovered_models = discover_ts_folders("source_folder/GBDF", False)
-                # Filter for GRS models only
-                # Use source_dir as primary check since it always exists and contains the folder path
-                # Also check folder_name as fallback for robustness
-                grs_models = [
-                    m for m in discovered_models 
-                    if "gbd_grs" in m.get("source_dir", "").lower() or "gbd_grs" in m.get("folder_name", "").lower()
-                ]
-                if grs_models:
-                    print(f"Dynamic discovery found {len(grs_models)} GBDF GRS models")
-                    return grs_models
-                else:
-                    print("No GBDF GRS models found via dynamic discovery, falling back to static config")
-                    return STATIC_MODELS_CONFIG.get("gbd_grs", [])
-            else:
-                # Use dynamic discovery for WGS_CSBD
-                discovered_models = discover_ts_folders("source_folder/WGS_CSBD", True)
-                if discovered_models:
-                    print(f"Dynamic discovery found {len(discovered_models)} WGS_CSBD models")
-                    return discovered_models
-                else:
-                    print("No WGS_CSBD models found via dynamic discovery, falling back to static config")
-                    return STATIC_MODELS_CONFIG.get("wgs_csbd", [])
-        except Exception as e:
-            print(f"Dynamic discovery failed: {e}, falling back to static config")
-            if use_wgs_nyk:
-                return STATIC_MODELS_CONFIG.get("wgs_kernal", [])
-            elif use_gbd_mcr:
-                return STATIC_MODELS_CONFIG.get("gbd_mcr", [])
-            elif use_gbd_grs:
-                return STATIC_MODELS_CONFIG.get("gbd_grs", [])
-            else:
-                return STATIC_MODELS_CONFIG.get("wgs_csbd", [])
-    else:
-        if use_wgs_nyk:
-            return STATIC_MODELS_CONFIG.get("wgs_kernal", [])
-        elif use_gbd_mcr:
-            return STATIC_MODELS_CONFIG.get("gbd_mcr", [])
-        elif use_gbd_grs:
-            return STATIC_MODELS_CONFIG.get("gbd_grs", [])
-        else:
-            return STATIC_MODELS_CONFIG.get("wgs_csbd", [])
+    flags = {"use_wgs_nyk": use_wgs_nyk, "use_gbd_mcr": use_gbd_mcr, "use_gbd_grs": use_gbd_grs}
+    _, static_key, base_dir, csbd_destination, subtype, label = next(
+        (variant for variant in _MODEL_VARIANTS if flags[variant[0]]),
+        _DEFAULT_MODEL_VARIANT
+    )
+    
+    if not use_dynamic:
+        return _static_models_copy(static_key)
+    
+    try:
+        discovered_models = discover_ts_folders(base_dir, csbd_destination, subtype=subtype)
+    except Exception as e:
+        print(f"Dynamic discovery failed: {e}, falling back to static config")
+        return _static_models_copy(static_key)
+    
+    if discovered_models:
+        print(f"Dynamic discovery found {len(discovered_models)} {label} models")
+        return discovered_models
+    print(f"No {label} models found via dynamic discovery, falling back to static config")
+    return _static_models_copy(static_key)
 
 def get_model_by_ts(ts_number):
     """
@@ -1535,6 +1499,126 @@ def get_model_by_ts(ts_number):
         print(f"Error getting model for TS_{ts_number}: {e}")
         return None
 
+# Static config lookups
+# STATIC_MODELS_CONFIG stays the source of truth (auto_edit_processor.py edits the
+# literal in place), so keyed lookups go through an index built from it on first use.
+@lru_cache(maxsize=None)
+def get_static_models(model_type):
+    """
+    Get the static model configurations for one model type as an immutable tuple.
+
+    STATIC_MODELS_CONFIG itself stays a dict of lists (auto_edit_processor.py edits
+    the literal as text). This snapshot holds read-only mappings, so callers cannot
+    mutate the shared static config and the cached snapshot can be shared safely.
+
+    Args:
+        model_type: STATIC_MODELS_CONFIG section (e.g., "wgs_csbd", "gbdf_mcr")
+
+    Returns:
+        Tuple of read-only model configuration mappings (empty if the section does not exist)
+    """
+    entries = tuple(MappingProxyType(entry) for entry in STATIC_MODELS_CONFIG.get(model_type, ()))
+    _report_static_duplicates(model_type, entries)
+    return entries
+
+
+def _report_static_duplicates(model_type, entries):
+    """
+    Warn once about entries that collide on ts_number, (edit_id, code) or (source_dir, dest_dir).
+
+    Duplicates make two models rename the same payloads, so they are reported when a
+    section is first loaded.
+    """
+    key_fields = (
+        ("ts_number",),
+        ("edit_id", "code"),
+        ("source_dir", "dest_dir"),
+    )
+    for fields in key_fields:
+        seen = set()
+        duplicates = []
+        for entry in entries:
+            key = tuple(entry.get(field) for field in fields)
+            if key in seen:
+                duplicates.append(f"TS_{entry.get('ts_number')} ({entry.get('edit_id')}_{entry.get('code')})")
+            else:
+                seen.add(key)
+        if duplicates:
+            print(f"[WARNING] {model_type}: {len(duplicates)} duplicate {'/'.join(fields)} entries: {', '.join(duplicates)}")
+
+
+@lru_cache(maxsize=None)
+def _static_edit_id_index(model_type):
+    """Build an {edit_id: (entries...)} index for one STATIC_MODELS_CONFIG section."""
+    index = {}
+    for entry in get_static_models(model_type):
+        index.setdefault(entry["edit_id"], []).append(entry)
+    return {edit_id: tuple(entries) for edit_id, entries in index.items()}
+
+
+def get_static_models_by_edit_id(model_type, edit_id):
+    """
+    Get static model configurations by model type and edit ID.
+
+    Args:
+        model_type: STATIC_MODELS_CONFIG section (e.g., "wgs_csbd", "gbdf_mcr")
+        edit_id: Edit ID (e.g., "RULEEM000001")
+
+    Returns:
+        Tuple of matching read-only model configuration mappings (empty if none match)
+    """
+    return _static_edit_id_index(model_type).get(edit_id, ())
+
+
+def _static_models_copy(model_type):
+    """
+    Get mutable copies of one section's static entries for get_models_config().
+
+    Copies keep per-run changes out of STATIC_MODELS_CONFIG; going through
+    get_static_models() also reports duplicate entries once per section.
+    """
+    return [dict(entry) for entry in get_static_models(model_type)]
+
+def index_models_by_ts(models):
+    """
+    Group model configurations by ts_number so repeated lookups skip a list scan.
+
+    Args:
+        models: Model configurations, e.g. the list returned by get_models_config()
+
+    Returns:
+        Dict of ts_number -> list of matching models, in their original order
+        (smoke and regression variants share a TS number)
+    """
+    models_by_ts = {}
+    for model in models:
+        models_by_ts.setdefault(model.get("ts_number"), []).append(model)
+    return models_by_ts
+
+def ensure_dest_dirs(models):
+    """
+    Create the destination directories for a batch of models in one pass.
+
+    Pass models that already passed validation (main_processor._validate_model_config
+    checks that a given source_dir exists), so source directories are not stat'ed
+    again here. Only models with a source_dir get a destination; models relying on
+    rename_files' default paths create their own. Unique directories are created in
+    sorted order so shared parents are made once and later calls hit existing paths.
+
+    Args:
+        models: Iterable of validated model configuration mappings
+
+    Returns:
+        Sorted list of the unique destination directories ensured
+    """
+    dest_dirs = sorted({
+        model["dest_dir"] for model in models
+        if model.get("dest_dir") and model.get("source_dir")
+    })
+    for dest_dir in dest_dirs:
+        os.makedirs(dest_dir, exist_ok=True)
+    return dest_dirs
+
 # For backward compatibility, lazily resolve MODELS_CONFIG on access
 def __getattr__(name):
     if name == "MODELS_CONFIG":
@@ -1546,38 +1630,102 @@ GENERATE_POSTMAN_COLLECTIONS = True
 VERBOSE_OUTPUT = True
 
 
-def apply_header_footer_to_json(file_path, is_wgs_kernal=False):
+# Header/footer wrapper written around every payload, in output key order.
+# "payload" is a placeholder filled per file; meta-transid differs for WGS_Kernal
+# ("20240705012036TMBLMMY437A003580999CS90TIMBER01") and WGS_CSBD ("20220117181853TMBL20359Cl893580999").
+_HEADER_FOOTER_WGS_CSBD = MappingProxyType({
+    "adhoc": "true",
+    "analyticId": " ",
+    "hints": ("congnitive_claims_async",),
+    "payload": None,
+    "responseRequired": "false",
+    "meta-src-envrmt": "IMST",
+    "meta-transid": "20220117181853TMBL20359Cl893580999",
+    "protegrity": "false",
+    "Protigrity": "false",
+})
+_HEADER_FOOTER_WGS_KERNAL = MappingProxyType(
+    {**_HEADER_FOOTER_WGS_CSBD, "meta-transid": "20240705012036TMBLMMY437A003580999CS90TIMBER01"}
+)
+_HEADER_FOOTER_KEYS = frozenset(_HEADER_FOOTER_WGS_CSBD)
+
+
+def _header_footer_affixes(prototype):
+    """Return the exact bytes written before and after the payload for a header/footer prototype."""
+    encoded = encode_json_bytes(dict(prototype))
+    prefix, suffix = encoded.split(b'"payload": null', 1)
+    return prefix + b'"payload": ', suffix
+
+
+# (prefix, suffix) bytes keyed by is_wgs_kernal
+_HEADER_FOOTER_AFFIXES = {
+    False: _header_footer_affixes(_HEADER_FOOTER_WGS_CSBD),
+    True: _header_footer_affixes(_HEADER_FOOTER_WGS_KERNAL),
+}
+
+
+def _write_bytes_atomic(file_path, data):
     """
-    Apply header and footer structure to JSON files.
-    Wraps the existing JSON content with header and footer metadata.
-    
-    This function ALWAYS ensures the header/footer structure is present,
-    even if the file already has it (to ensure consistency).
-    
-    Header structure:
-    - adhoc: "true"
-    - analyticId: " "
-    - hints: ["congnitive_claims_async"]
-    - payload: {existing JSON content}
-    
-    Footer structure:
-    - responseRequired: "false"
-    - meta-src-envrmt: "IMST"
-    - meta-transid: WGS_Kernal uses "20240705012036TMBLMMY437A003580999CS90TIMBER01",
-                   WGS_CSBD uses "20220117181853TMBL20359Cl893580999"
-    - protegrity / Protigrity: "false" (for WGS_Kernal and WGS_CSBD models)
-    
+    Replace a file's content so readers never see a partially written file.
+
+    The data is written to "<file_path>.tmp" and moved over the target with
+    os.replace; the temporary file is removed if anything fails.
+
+    Args:
+        file_path: Path of the file to write
+        data: Bytes to write
+    """
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _apply_header_footer(file_path, is_wgs_kernal=False):
+    """
+    Apply header/footer to one JSON file and report what happened.
+
     Args:
         file_path: Path to the JSON file to transform
         is_wgs_kernal: If True, use WGS_Kernal meta-transid; else use WGS_CSBD meta-transid
-        
+
+    Per-file progress lines are only printed when VERBOSE_OUTPUT is set; errors
+    are always printed.
+    
     Returns:
-        bool: True if transformation was successful, False otherwise
+        str: "applied" if the file was rewritten, "unchanged" if it already had the
+             exact target content (no write), "error" on failure
+
+    "Exact target content" means the bytes encode_json_bytes produces, so a file with
+    the right data but other formatting (indentation, line endings) is rewritten once.
     """
     try:
         # Read the existing JSON content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
+        raw = Path(file_path).read_bytes()
+        
+        # Fast path: a file this function already wrapped starts and ends with the exact
+        # header/footer bytes (no extra keys, current values). It is only up to date if
+        # the bytes in between are a single JSON value; anything else (truncated payload,
+        # extra keys spliced in after it) goes through the full parse-and-rewrite below
+        prefix, suffix = _HEADER_FOOTER_AFFIXES[bool(is_wgs_kernal)]
+        if len(raw) > len(prefix) + len(suffix) and raw.startswith(prefix) and raw.endswith(suffix):
+            try:
+                parse_json_bytes(raw[len(prefix):-len(suffix)])
+            except ValueError:
+                pass
+            else:
+                if VERBOSE_OUTPUT:
+                    print(f"[INFO] Header/footer already up to date: {file_path}")
+                return "unchanged"
+        
+        existing_data = parse_json_bytes(raw)
         
         # Check if the file already has the correct structure
         has_correct_structure = (isinstance(existing_data, dict) and 
@@ -1587,73 +1735,203 @@ def apply_header_footer_to_json(file_path, is_wgs_kernal=False):
                                 "meta-src-envrmt" in existing_data and
                                 "meta-transid" in existing_data)
         
-        # meta-transid: WGS_Kernal uses dedicated value; WGS_CSBD uses legacy value
-        meta_transid = "20240705012036TMBLMMY437A003580999CS90TIMBER01" if is_wgs_kernal else "20220117181853TMBL20359Cl893580999"
-        # Header and footer structure (always use these values)
-        header_footer = {
-            "adhoc": "true",
-            "analyticId": " ",
-            "hints": ["congnitive_claims_async"],
-            "responseRequired": "false",
-            "meta-src-envrmt": "IMST",
-            "meta-transid": meta_transid,
-            "protegrity": "false",
-            "Protigrity": "false"
-        }
-        
-        # Always ensure header/footer structure is correct
         if has_correct_structure:
             # File has structure, but ensure all header/footer fields are correct
-            new_structure = {
-                "adhoc": header_footer["adhoc"],
-                "analyticId": header_footer["analyticId"],
-                "hints": header_footer["hints"],
-                "payload": existing_data.get("payload", existing_data),  # Use existing payload or entire data
-                "responseRequired": header_footer["responseRequired"],
-                "meta-src-envrmt": header_footer["meta-src-envrmt"],
-                "meta-transid": header_footer["meta-transid"],
-                "protegrity": header_footer["protegrity"],
-                "Protigrity": header_footer["Protigrity"]
-            }
+            new_structure = dict(_HEADER_FOOTER_WGS_KERNAL if is_wgs_kernal else _HEADER_FOOTER_WGS_CSBD)
+            new_structure["hints"] = list(new_structure["hints"])
+            new_structure["payload"] = existing_data.get("payload", existing_data)  # Use existing payload or entire data
             
             # Preserve any additional fields that might exist
             for key, value in existing_data.items():
-                if key not in ["adhoc", "analyticId", "hints", "payload", "responseRequired", "meta-src-envrmt", "meta-transid", "protegrity", "Protigrity"]:
+                if key not in _HEADER_FOOTER_KEYS:
                     new_structure[key] = value
             
+            # Skip the write on re-runs where the file is already exactly right
+            new_bytes = encode_json_bytes(new_structure)
+            if new_bytes == raw:
+                if VERBOSE_OUTPUT:
+                    print(f"[INFO] Header/footer already up to date: {file_path}")
+                return "unchanged"
+            
             # Write the updated structure back to the file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(new_structure, f, indent=2, ensure_ascii=False)
-            print(f"[INFO] Updated header/footer structure in: {file_path}")
+            _write_bytes_atomic(file_path, new_bytes)
+            if VERBOSE_OUTPUT:
+                print(f"[INFO] Updated header/footer structure in: {file_path}")
         else:
-            # File doesn't have correct structure, wrap existing data in payload
-            new_structure = {
-                "adhoc": header_footer["adhoc"],
-                "analyticId": header_footer["analyticId"],
-                "hints": header_footer["hints"],
-                "payload": existing_data,  # The existing JSON becomes the payload
-                "responseRequired": header_footer["responseRequired"],
-                "meta-src-envrmt": header_footer["meta-src-envrmt"],
-                "meta-transid": header_footer["meta-transid"],
-                "protegrity": header_footer["protegrity"],
-                "Protigrity": header_footer["Protigrity"]
-            }
+            # File doesn't have correct structure, wrap existing data in payload.
+            # The existing JSON becomes the payload: encode it alone, indent it one
+            # level (JSON strings never contain raw newlines) and splice it between
+            # the precomputed header/footer bytes (b'\r\n' line breaks end in b'\n' too)
+            payload_bytes = encode_json_bytes(existing_data).replace(b'\n', b'\n  ')
             
             # Write the transformed JSON back to the file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(new_structure, f, indent=2, ensure_ascii=False)
-            print(f"[SUCCESS] Applied header/footer to: {file_path}")
+            _write_bytes_atomic(file_path, prefix + payload_bytes + suffix)
+            if VERBOSE_OUTPUT:
+                print(f"[SUCCESS] Applied header/footer to: {file_path}")
         
-        return True
+        return "applied"
         
     except json.JSONDecodeError as e:
         print(f"[ERROR] Error parsing JSON in {file_path}: {e}")
-        return False
+        return "error"
     except Exception as e:
         print(f"[ERROR] Error applying header/footer to {file_path}: {e}")
-        return False
+        return "error"
+
+
+def apply_header_footer_to_json(file_path, is_wgs_kernal=False):
+    """
+    Apply header and footer structure to JSON files.
+    Wraps the existing JSON content with header and footer metadata.
+    
+    This function ALWAYS ensures the header/footer structure is present,
+    even if the file already has it (to ensure consistency). Files that already
+    contain exactly the target content are left untouched.
+    
+    Header structure:
+    - adhoc: "true"
+    - analyticId: " "
+    - hints: ["congnitive_claims_async"]
+    - payload: {existing JSON content}
+    
+    Footer structure:
+    - responseRequired: "false"
+    - meta-src-envrmt: "IMST"
+    - meta-transid: WGS_Kernal uses "20240705012036TMBLMMY437A003580999CS90TIMBER01",
+                   WGS_CSBD uses "20220117181853TMBL20359Cl893580999"
+    - protegrity / Protigrity: "false" (for WGS_Kernal and WGS_CSBD models)
+    
+    Args:
+        file_path: Path to the JSON file to transform
+        is_wgs_kernal: If True, use WGS_Kernal meta-transid; else use WGS_CSBD meta-transid
+        
+    Returns:
+        bool: True if transformation was successful, False otherwise
+    """
+    return _apply_header_footer(file_path, is_wgs_kernal=is_wgs_kernal) != "error"
+
+
+# Manifest of files the header/footer pass has already handled, as {path: [mtime_ns, size]}
+_HEADER_FOOTER_MANIFEST = os.path.join("renaming_jsons", ".header_footer_manifest")
+
+# Bumped when the rules for recording a file change; version 2 only records files whose
+# payload was parsed, so manifests from older runs are discarded and re-checked
+_HEADER_FOOTER_MANIFEST_VERSION = 2
+
+# Identifies the header/footer template a manifest was written for; a manifest from
+# a different template is ignored so files get re-checked after a template change
+_HEADER_FOOTER_TEMPLATE_ID = hashlib.sha1(
+    repr((_HEADER_FOOTER_MANIFEST_VERSION, sorted(_HEADER_FOOTER_AFFIXES.items()))).encode('utf-8')
+).hexdigest()
+
+
+def _load_header_footer_manifest(manifest_path):
+    """
+    Load the header/footer manifest.
+
+    Args:
+        manifest_path: Path to the manifest file
+
+    Returns:
+        dict: {file_path: [mtime_ns, size]}; empty if the manifest is missing,
+              unreadable or was written for a different template
+    """
+    try:
+        manifest = parse_json_bytes(Path(manifest_path).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("template") != _HEADER_FOOTER_TEMPLATE_ID:
+        return {}
+    files = manifest.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_header_footer_manifest(manifest_path, files):
+    """
+    Write the header/footer manifest.
+
+    Args:
+        manifest_path: Path to the manifest file
+        files: {file_path: [mtime_ns, size]} for every file known to be up to date
+    """
+    manifest = {"template": _HEADER_FOOTER_TEMPLATE_ID, "files": files}
+    try:
+        _write_bytes_atomic(manifest_path, encode_json_bytes(manifest))
+    except OSError as e:
+        print(f"[WARNING] Could not write header/footer manifest {manifest_path}: {e}")
+
+
+def _file_signature(file_path):
+    """
+    Return [mtime_ns, size] for a file, or None if it cannot be stat'ed.
+
+    file_path may be an os.DirEntry, whose stat() result is cached on the entry
+    (and comes from the directory scan itself on Windows).
+    """
+    try:
+        st = file_path.stat() if isinstance(file_path, os.DirEntry) else os.stat(file_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
 
 
+def _apply_header_footer_tracked(entry, is_wgs_kernal, manifest):
+    """
+    Apply header/footer to one file unless the manifest shows it is unchanged since
+    the last run.
+
+    Args:
+        entry: os.DirEntry of the JSON file to transform
+        is_wgs_kernal: If True, use WGS_Kernal meta-transid; else use WGS_CSBD meta-transid
+        manifest: {file_path: [mtime_ns, size]} loaded from the previous run
+
+    Returns:
+        tuple: (status, signature) where status is "cached" for a manifest hit or the
+               result of _apply_header_footer, and signature is the file's
+               [mtime_ns, size] after processing. Only files whose content was parsed
+               and found valid ("applied" or "unchanged") get a signature; it is
+               None for anything else, so such files are re-checked on the next run
+    """
+    file_path = entry.path
+    signature = _file_signature(entry)
+    if signature is not None and manifest.get(file_path) == signature:
+        return "cached", signature
+    
+    status = _apply_header_footer(file_path, is_wgs_kernal=is_wgs_kernal)
+    if status == "applied":
+        return status, _file_signature(file_path)
+    if status == "unchanged":
+        return status, signature
+    return status, None
+
+
+def _iter_json_files(root):
+    """
+    Recursively yield the directory entries of all *.json files under root.
+
+    Walks the tree with os.scandir and an explicit stack so file/directory checks
+    reuse each entry's cached type. Like os.walk, symlinked directories are not
+    followed and unreadable directories are skipped.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        os.DirEntry for each JSON file found
+    """
+    stack = [root]
+    while stack:
+        top = stack.pop()
+        try:
+            with os.scandir(top) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.json') and entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
 def apply_header_footer_to_renaming_jsons():
     """
     Apply header and footer to all JSON files in renaming_jsons folder
@@ -1663,7 +1941,13 @@ def apply_header_footer_to_renaming_jsons():
     - renaming_jsons/CSBDTS/**
     - renaming_jsons/NYKTS/**
     
-    and applies the header/footer structure to each file.
+    and applies the header/footer structure to each file. Files are processed
+    concurrently; set HF_THREADS to control the number of worker threads.
+    
+    The modification time and size of every up-to-date file is recorded in
+    renaming_jsons/.header_footer_manifest, and files that have not changed
+    since the previous run are skipped without being read. Delete the manifest
+    to force every file to be re-checked.
     
     Returns:
         dict: Statistics about processed files
@@ -1673,6 +1957,14 @@ def apply_header_footer_to_renaming_jsons():
     skipped_count = 0
     error_count = 0
     
+    # Worker threads from HF_THREADS (unset, invalid or <= 0 = ThreadPoolExecutor default)
+    try:
+        max_workers = int(os.getenv("HF_THREADS", "0"))
+    except ValueError:
+        max_workers = 0
+    if max_workers <= 0:
+        max_workers = None
+    
     # Directories to process
     target_dirs = [
         os.path.join(base_dir, "WGS_CSBD"),
@@ -1683,6 +1975,11 @@ def apply_header_footer_to_renaming_jsons():
     print("Applying header/footer to JSON files")
     print("=" * 60)
     
+    # Files unchanged since the last run (same mtime and size) are skipped unread
+    manifest = _load_header_footer_manifest(_HEADER_FOOTER_MANIFEST)
+    new_manifest = {}
+    cached_count = 0
+    
     for target_dir in target_dirs:
         if not os.path.exists(target_dir):
             print(f"[WARNING] Directory not found: {target_dir}")
@@ -1691,18 +1988,32 @@ def apply_header_footer_to_renaming_jsons():
         print(f"\nProcessing directory: {target_dir}")
         print("-" * 60)
         
-        # Recursively find all JSON files
         is_wgs_kernal = "WGS_KERNAL" in target_dir.upper()
-        for root, dirs, files in os.walk(target_dir):
-            for filename in files:
-                if filename.endswith('.json'):
-                    file_path = os.path.join(root, filename)
-                    
-                    # Apply header/footer (function will handle both new and existing structures)
-                    if apply_header_footer_to_json(file_path, is_wgs_kernal=is_wgs_kernal):
-                        processed_count += 1
-                    else:
-                        error_count += 1
+        
+        # Apply header/footer (function will handle both new and existing structures)
+        # to every JSON file found recursively. Files are independent and the work
+        # is I/O bound, so they are processed on a thread pool
+        entries = list(_iter_json_files(target_dir))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda entry: _apply_header_footer_tracked(entry, is_wgs_kernal, manifest),
+                entries
+            )
+            for entry, (status, signature) in zip(entries, results):
+                if status == "applied":
+                    processed_count += 1
+                elif status in ("unchanged", "cached"):
+                    skipped_count += 1
+                    cached_count += status == "cached"
+                else:
+                    error_count += 1
+                if signature is not None:
+                    new_manifest[entry.path] = signature
+    
+    if cached_count:
+        print(f"\n[INFO] {cached_count} files unchanged since the last run (not re-read)")
+    if os.path.isdir(base_dir):
+        _save_header_footer_manifest(_HEADER_FOOTER_MANIFEST, new_manifest)
     
     print("\n" + "=" * 60)
     print("Header/Footer Application Summary")
@@ -22,8 +22,8 @@ if sys.platform == 'win32':
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-# Import the Postman generator - main class that handles collection generation
-from postman_generator import PostmanCollectionGenerator
+# The Postman generator is imported inside each handler so that commands which
+# fail argument parsing (or print help) do not pay for loading it.
 
 
 def main():
@@ -91,16 +91,7 @@ Examples:
     
     # Stage 11: Route to appropriate handler function based on command
     try:
-        if args.command == "generate":
-            handle_generate(args)  # Handle single collection generation
-        elif args.command == "generate-all":
-            handle_generate_all(args)  # Handle bulk collection generation
-        elif args.command == "list-directories":
-            handle_list_directories(args)  # Handle directory listing
-        elif args.command == "stats":
-            handle_stats(args)  # Handle statistics display
-        elif args.command == "validate":
-            handle_validate(args)  # Handle collection validation
+        _HANDLERS[args.command](args)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -108,6 +99,8 @@ Examples:
 
 def handle_generate(args):
     """Handle the generate command."""
+    from postman_generator import PostmanCollectionGenerator
+
     # Stage 12: Initialize collection generation process
     print("🔧 Generating Postman API collection...")
     print("=" * 50)
@@ -150,6 +143,8 @@ def handle_generate(args):
 
 def handle_generate_all(args):
     """Handle the generate-all command."""
+    from postman_generator import PostmanCollectionGenerator
+
     # Stage 16: Initialize bulk collection generation process
     print("🔧 Generating single Postman API collection for all files...")
     print("=" * 50)
@@ -184,6 +179,8 @@ def handle_generate_all(args):
 
 def handle_list_directories(args):
     """Handle the list-directories command."""
+    from postman_generator import PostmanCollectionGenerator
+
     # Stage 20: Initialize generator for directory listing
     generator = PostmanCollectionGenerator(source_dir=args.source_dir)
     
@@ -212,6 +209,8 @@ def handle_list_directories(args):
 
 def handle_stats(args):
     """Handle the stats command."""
+    from postman_generator import PostmanCollectionGenerator
+
     # Stage 23: Initialize generator for statistics retrieval
     generator = PostmanCollectionGenerator(source_dir=args.source_dir)
     
@@ -235,6 +234,8 @@ def handle_stats(args):
 
 def handle_validate(args):
     """Handle the validate command."""
+    from postman_generator import PostmanCollectionGenerator
+
     # Stage 27: Convert collection path to Path object for file operations
     collection_path = Path(args.collection_path)
     
@@ -272,6 +273,16 @@ def handle_validate(args):
             print(f"  {key}: {value}")
 
 
+# Command name -> handler mapping used by main() for dispatch
+_HANDLERS = {
+    "generate": handle_generate,                  # Handle single collection generation
+    "generate-all": handle_generate_all,          # Handle bulk collection generation
+    "list-directories": handle_list_directories,  # Handle directory listing
+    "stats": handle_stats,                        # Handle statistics display
+    "validate": handle_validate,                  # Handle collection validation
+}
+
+
 # Stage 34: Entry point - run main function when script is executed directly
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -26,9 +26,12 @@ import os
 import sys
 import argparse
 import re
+import shutil
 from pathlib import Path
 from typing import Dict, Optional, List
 
+from json_io import load_json_file, dump_json_file
+
 # Load .env so ENABLE_REFDB_* are available (standalone and when used from main_processor)
 try:
     from dotenv import load_dotenv
@@ -339,14 +342,12 @@ def process_json_file(file_path: Path, replacements: Dict[str, str], backup: boo
     
     try:
         # Read the JSON file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(file_path)
         
-        # Create backup if requested
+        # Create backup if requested - a byte-for-byte copy of the original file
         if backup:
             backup_path = file_path.with_suffix(file_path.suffix + '.bak')
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            shutil.copyfile(file_path, backup_path)
             print(f"  Backup created: {backup_path}")
         
         # Replace values
@@ -355,8 +356,7 @@ def process_json_file(file_path: Path, replacements: Dict[str, str], backup: boo
         
         if count > 0:
             # Write the modified JSON back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(modified_data, f, indent=2, ensure_ascii=False)
+            dump_json_file(file_path, modified_data)
             print(f"  ✓ Successfully replaced {count} value(s)")
             return True
         else:
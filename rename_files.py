@@ -15,11 +15,28 @@ This functionality was extracted from main_processor.py for better code organiza
 
 import os
 import re
+import errno
 import shutil
 import json
 from postman_generator import PostmanCollectionGenerator
+from json_io import iter_payload_files, load_json_file, dump_json_file
 from report_generate import ExcelReportGenerator, TimingTracker, get_excel_reporter
 
+# Destination folder name patterns per model LOB, compiled once: (pattern, is_gbdf)
+_WGS_CSBD_DIR_PATTERNS = (
+    (re.compile(r'CSBDTS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|dis)$'), False),
+    (re.compile(r'TS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|dis)$'), False),
+)
+# GBDF folders are spelled gbd_mcr/gbd_grs on disk (older ones gbdf_) and edit IDs may
+# contain underscores, matching dynamic_models._GBDF_FOLDER_PATTERNS
+_GBDF_DIR_PATTERNS = (
+    (re.compile(r'TS_(\d{1,3})_(.+?)_gbdf?_(mcr|grs)_(.+)_([A-Za-z0-9]+)_(sur|dis)$'), True),
+    (re.compile(r'GBDTS_(\d{1,3})_(.+?)_gbdf?_(mcr|grs)_(.+)_([A-Za-z0-9]+)_(sur|dis)$'), True),
+)
+_WGS_NYK_DIR_PATTERNS = (
+    (re.compile(r'NYKTS_(\d{1,3})_(.+?)_WGS_NYK_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|dis)$'), False),
+)
+
 
 def extract_model_info_from_directory(dest_dir: str, renamed_files: list) -> dict:
     """
@@ -63,21 +80,13 @@ def extract_model_info_from_directory(dest_dir: str, renamed_files: list) -> dic
         patterns = []
         if "CSBDTS" in dest_dir or "WGS_CSBD" in dest_dir:
             model_info["model_lob"] = "WGS_CSBD"
-            patterns = [
-                (r'CSBDTS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|dis)$', False),
-                (r'TS_(\d{1,3})_(.+?)_WGS_CSBD_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|dis)$', False)
-            ]
+            patterns = _WGS_CSBD_DIR_PATTERNS
         elif "GBDTS" in dest_dir or "GBDF" in dest_dir:
             model_info["model_lob"] = "GBDF_MCR" if "mcr" in dest_dir.lower() else "GBDF_GRS" if "grs" in dest_dir.lower() else "GBDF"
-            patterns = [
-                (r'TS_(\d{1,3})_(.+?)_gbdf_(mcr|grs)_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|dis)$', True),
-                (r'GBDTS_(\d{1,3})_(.+?)_gbdf_(mcr|grs)_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|dis)$', True)
-            ]
+            patterns = _GBDF_DIR_PATTERNS
         elif "NYKTS" in dest_dir or "WGS_KERNAL" in dest_dir or "WGS_NYK" in dest_dir:
             model_info["model_lob"] = "WGS_NYK"
-            patterns = [
-                (r'NYKTS_(\d{1,3})_(.+?)_WGS_NYK_([A-Za-z0-9]+)_([A-Za-z0-9]+)_(sur|dis)$', False)
-            ]
+            patterns = _WGS_NYK_DIR_PATTERNS
         
         # Try patterns in directory traversal
         current_path = dest_dir
@@ -86,7 +95,7 @@ def extract_model_info_from_directory(dest_dir: str, renamed_files: list) -> dic
             dir_name = os.path.basename(current_path)
             
             for pattern, is_gbdf in patterns:
-                if extract_from_match(re.match(pattern, dir_name), is_gbdf):
+                if extract_from_match(pattern.match(dir_name), is_gbdf):
                     return model_info
             
             if dir_name in ["CSBDTS", "GBDTS", "NYKTS", "WGS_CSBD", "GBDF", "WGS_KERNAL", "WGS_NYK", "renaming_jsons", "source_folder", ""]:
@@ -96,7 +105,7 @@ def extract_model_info_from_directory(dest_dir: str, renamed_files: list) -> dic
         path_parts = dest_dir.split(os.sep)
         for part in path_parts:
             for pattern, is_gbdf in patterns:
-                if extract_from_match(re.search(pattern, part), is_gbdf):
+                if extract_from_match(pattern.search(part), is_gbdf):
                     return model_info
         
         # Final fallback: Extract from filename
@@ -129,8 +138,7 @@ def clean_duplicate_fields_csbd(file_path):
     """
     try:
         # Read the existing JSON content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
+        existing_data = load_json_file(file_path)
         
         # Check if the file has duplicate fields in the payload
         if (isinstance(existing_data, dict) and 
@@ -158,8 +166,7 @@ def clean_duplicate_fields_csbd(file_path):
                 existing_data["payload"] = cleaned_payload
                 
                 # Write the cleaned JSON back to the file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
+                dump_json_file(file_path, existing_data)
                 
                 print(f"[SUCCESS] Cleaned duplicate fields from {file_path}")
                 return True
@@ -202,8 +209,7 @@ def apply_wgs_csbd_header_footer(file_path, is_wgs_kernal=False):
     
     try:
         # Read the existing JSON content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
+        existing_data = load_json_file(file_path)
         
         # Check if the file already has the correct structure
         has_correct_structure = (isinstance(existing_data, dict) and 
@@ -261,8 +267,7 @@ def apply_wgs_csbd_header_footer(file_path, is_wgs_kernal=False):
                 new_structure["KEY_CHK_DCN_NBR"] = existing_data["KEY_CHK_DCN_NBR"]
             
             # Write the updated structure back to the file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(new_structure, f, indent=2, ensure_ascii=False)
+            dump_json_file(file_path, new_structure)
             print(f"[INFO] Updated header/footer structure in: {file_path}")
         else:
             # File doesn't have correct structure, wrap existing data in payload
@@ -278,8 +283,7 @@ def apply_wgs_csbd_header_footer(file_path, is_wgs_kernal=False):
             }
             
             # Write the transformed JSON back to the file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(new_structure, f, indent=2, ensure_ascii=False)
+            dump_json_file(file_path, new_structure)
             print(f"[SUCCESS] Applied header/footer structure to: {file_path}")
         
         return True
@@ -315,8 +319,7 @@ def apply_gbdf_clcl_id_generation(file_path):
         return False
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
+        existing_data = load_json_file(file_path)
         
         random_11_digit = str(random.randint(10000000000, 99999999999))
         clcl_id_updated = False
@@ -334,8 +337,7 @@ def apply_gbdf_clcl_id_generation(file_path):
                 clcl_id_updated = True
         
         if clcl_id_updated:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+            dump_json_file(file_path, existing_data)
             print(f"[SUCCESS] Applied CLCL_ID generation to: {file_path}")
             return True
         else:
@@ -372,7 +374,28 @@ def validate_suffix(suffix, filename):
     return True
 
 
-def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None, generate_postman=True, postman_collection_name=None, postman_file_name=None, excel_reporter=None):
+def move_file(source_path, dest_path):
+    """
+    Move a file to its new name, replacing any existing destination.
+
+    Uses a single os.replace when source and destination are on the same
+    filesystem; falls back to copy + remove (shutil.copy2) only for cross-device
+    moves (EXDEV). Any other OSError is raised unchanged.
+
+    Args:
+        source_path: Path of the file to move
+        dest_path: Destination path including the new file name
+    """
+    try:
+        os.replace(source_path, dest_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(source_path, dest_path)
+        os.remove(source_path)
+
+
+def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None, generate_postman=True, postman_collection_name=None, postman_file_name=None, excel_reporter=None, create_dest_dir=True):
     """
     STAGE 1: FILE RENAMING FUNCTION
     ===============================
@@ -396,6 +419,8 @@ def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None,
         postman_collection_name: Name for the Postman collection
         postman_file_name: Custom filename for the Postman collection JSON file
         excel_reporter: Excel reporter instance for timing tracking
+        create_dest_dir: If False, dest_dir is assumed to exist already (batch callers
+            create all destinations up front with models_config.ensure_dest_dirs)
         
     Returns:
         list: List of renamed file names
@@ -445,12 +470,13 @@ def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None,
         return []
     
     # Create destination directory if it doesn't exist
-    os.makedirs(dest_dir, exist_ok=True)
+    if create_dest_dir:
+        os.makedirs(dest_dir, exist_ok=True)
     
     # STAGE 1.3: FILE DISCOVERY
     # =========================
     # Get all JSON files in the source directory
-    json_files = [f for f in os.listdir(source_dir) if f.endswith('.json')]
+    json_files = [entry.name for entry in iter_payload_files(source_dir)]
     
     print("Files to be renamed and moved:")
     print("=" * 60)
@@ -503,10 +529,9 @@ def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None,
             dest_path = os.path.normpath(os.path.join(dest_dir, new_filename))
             
             try:
-                # Copy the file to destination with new name
-                # Use shutil.copy2 for cross-platform compatibility
-                shutil.copy2(source_path, dest_path)
-                print(f"Successfully copied and renamed: {filename} -> {new_filename}")
+                # Move the file to destination with new name
+                move_file(source_path, dest_path)
+                print(f"Successfully moved and renamed: {filename} -> {new_filename}")
                 
                 # Apply header/footer transformation for WGS_CSBD, WGS_KERNAL, and WGS_NYK (NYKTS) files
                 if "WGS_CSBD" in dest_dir or "WGS_KERNAL" in dest_dir or "WGS_Kernal" in dest_dir or "NYKTS" in dest_dir or "WGS_NYK" in dest_dir:
@@ -526,10 +551,6 @@ def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None,
                     else:
                         print(f"[WARNING] Failed to apply CLCL_ID generation to: {new_filename}")
                 
-                # Remove the original file
-                os.remove(source_path)
-                print(f"Removed original file: {filename}")
-                
                 renamed_files.append(new_filename)
                 
             except Exception as e:
@@ -569,9 +590,9 @@ def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None,
             dest_path = os.path.normpath(os.path.join(dest_dir, new_filename))
             
             try:
-                # Copy the file to destination with new name
-                shutil.copy2(source_path, dest_path)
-                print(f"Successfully copied and renamed: {filename} -> {new_filename}")
+                # Move the file to destination with new name
+                move_file(source_path, dest_path)
+                print(f"Successfully moved and renamed: {filename} -> {new_filename}")
                 
                 # Apply header/footer transformation for WGS_CSBD, WGS_KERNAL, and WGS_NYK (NYKTS) files
                 if "WGS_CSBD" in dest_dir or "WGS_KERNAL" in dest_dir or "WGS_Kernal" in dest_dir or "NYKTS" in dest_dir or "WGS_NYK" in dest_dir:
@@ -591,10 +612,6 @@ def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None,
                     else:
                         print(f"[WARNING] Failed to apply CLCL_ID generation to: {new_filename}")
                 
-                # Remove the original file
-                os.remove(source_path)
-                print(f"Removed original file: {filename}")
-                
                 renamed_files.append(new_filename)
                 
             except Exception as e:
@@ -647,8 +664,8 @@ def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None,
                 dest_path = os.path.join(dest_dir, new_filename)
                 
                 try:
-                    # Copy the file to destination
-                    shutil.copy2(source_path, dest_path)
+                    # Move the file to destination
+                    move_file(source_path, dest_path)
                     print(f"Successfully moved: {filename}")
                     
                     # Apply header/footer transformation for WGS_CSBD, WGS_KERNAL, and WGS_NYK (NYKTS) files
@@ -669,10 +686,6 @@ def rename_files(edit_id="rvn001", code="00W5", source_dir=None, dest_dir=None,
                         else:
                             print(f"[WARNING] Failed to apply CLCL_ID generation to: {new_filename}")
                     
-                    # Remove the original file
-                    os.remove(source_path)
-                    print(f"Removed original file: {filename}")
-                    
                     renamed_files.append(new_filename)
                     
                 except Exception as e: